@@ -1,6 +1,7 @@
 from __future__ import print_function
 import numpy as np
 from discretize.utils import mkvc
+from .io_utils_general import WRITE_BUFFER_SIZE
 
 
 ########################################################################################
@@ -423,7 +424,7 @@ def _write_dcip_3d_or_octree_ubc(
         file_type = "dobs"
 
     # Write comments and IP type (if applicable)
-    with open(file_name, "w") as fid:
+    with open(file_name, "w", buffering=WRITE_BUFFER_SIZE) as fid:
         fid.write(f"! {format_type} FORMAT\n")
 
         if comment_lines is not None and len(comment_lines) > 0:
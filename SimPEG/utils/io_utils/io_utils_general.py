@@ -1,6 +1,10 @@
 from __future__ import print_function
 import numpy as np
 
+# Buffer size used when writing large data files, to limit the number of
+# write calls made for surveys with many rows
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 def read_GOCAD_ts(tsfile):
     """
@@ -1,7 +1,78 @@
 from __future__ import print_function
+import itertools
+import os
 import numpy as np
 from discretize.utils import mkvc
 from ...utils.code_utils import deprecate_method
+from .io_utils_general import WRITE_BUFFER_SIZE
+
+# File extension written/read as a binary float64 block instead of UBC text
+_BINARY_EXTENSION = ".npy"
+
+
+def _write_binary_block(filename, data):
+    """
+    Write a 2D array of locations and data columns as a binary .npy block.
+    """
+    with open(filename, "wb") as fid:
+        np.save(fid, np.atleast_2d(np.asarray(data, dtype=np.float64)))
+
+
+def _read_binary_block(filename):
+    """
+    Load a binary .npy block written by _write_binary_block.
+    """
+    return np.load(filename)
+
+
+def _read_text_block(fid, ndat):
+    """
+    Parse the ndat data rows following the header of an open UBC file.
+
+    Blank lines are skipped and anything after the ndat data rows is ignored.
+    All rows must have the same number of columns.
+    """
+    rows = list(itertools.islice((line for line in fid if line.strip()), ndat))
+    if len(rows) < ndat:
+        raise IOError(
+            "Expected {} data rows in {} but found {}".format(
+                ndat, fid.name, len(rows)
+            )
+        )
+
+    try:
+        block = np.loadtxt(rows, dtype=np.float64, comments=None, ndmin=2)
+    except ValueError as err:
+        raise IOError(
+            "Unable to read data rows in {}: {}".format(fid.name, err)
+        ) from err
+
+    if block.shape[0] != ndat:
+        raise IOError(
+            "Expected {} data rows in {} but parsed {}".format(
+                ndat, fid.name, block.shape[0]
+            )
+        )
+    return block
+
+
+def _split_block(block):
+    """
+    Split a block of [x, y, z, (data), (uncertainty)] rows into columns.
+    Missing data and uncertainty columns are returned as zeros. As for the
+    UBC format, uncertainties are only read from blocks with 5 columns.
+    """
+    ndat, n_col = block.shape
+
+    d = np.zeros(ndat, dtype=float)
+    wd = np.zeros(ndat, dtype=float)
+    locXYZ = np.array(block[:, :3], dtype=float)
+    if n_col > 3:
+        d[:] = block[:, 3]
+    if n_col == 5:
+        wd[:] = block[:, 4]
+
+    return locXYZ, d, wd
 
 
 def read_mag3d_ubc(obs_file):
@@ -23,43 +94,22 @@ def read_mag3d_ubc(obs_file):
     from ...potential_fields import magnetics
     from ...data import Data
 
-    fid = open(obs_file, "r")
-
-    # First line has the inclination,declination and amplitude of B0
-    line = fid.readline()
-    B = np.array(line.split()[:3], dtype=float)
-
-    # Second line has the magnetization orientation and a flag
-    line = fid.readline()
-    M = np.array(line.split()[:3], dtype=float)
-
-    # Third line has the number of rows
-    line = fid.readline()
-    ndat = int(line.split()[0])
-
-    # Pre-allocate space for obsx, obsy, obsz, data, uncert
-    line = fid.readline()
-    temp = np.array(line.split(), dtype=float)
-
-    d = np.zeros(ndat, dtype=float)
-    wd = np.zeros(ndat, dtype=float)
-    locXYZ = np.zeros((ndat, 3), dtype=float)
-
-    ii = 0
-    while ii < ndat:
+    with open(obs_file, "r") as fid:
 
-        temp = np.array(line.split(), dtype=float)
-        if len(temp) > 0:
-            locXYZ[ii, :] = temp[:3]
+        # First line has the inclination,declination and amplitude of B0
+        line = fid.readline()
+        B = np.array(line.split()[:3], dtype=float)
 
-            if len(temp) > 3:
-                d[ii] = temp[3]
+        # Second line has the magnetization orientation and a flag
+        line = fid.readline()
+        M = np.array(line.split()[:3], dtype=float)
 
-                if len(temp) == 5:
-                    wd[ii] = temp[4]
-            ii += 1
+        # Third line has the number of rows
         line = fid.readline()
-    fid.close()
+        ndat = int(line.split()[0])
+
+        # Remaining lines have obsx, obsy, obsz, data, uncert
+        locXYZ, d, wd = _split_block(_read_text_block(fid, ndat))
 
     if np.all(wd == 0.0):
         wd = None
@@ -110,17 +160,21 @@ def write_mag3d_ubc(filename, data_object):
         + "%6.2f %6.2f %6.2f\n" % (B[1], B[2], 1)
         + "%i\n" % survey.nD
     )
-    np.savetxt(
-        filename, data, fmt="%e", delimiter=" ", newline="\n", header=head, comments=""
-    )
+    with open(filename, "w", buffering=WRITE_BUFFER_SIZE) as fid:
+        np.savetxt(
+            fid, data, fmt="%e", delimiter=" ", newline="\n", header=head, comments=""
+        )
 
-    print("Observation file saved to: " + filename)
+    print("Observation file saved to: {}".format(filename))
 
 
 def read_grav3d_ubc(obs_file):
     """
     Read UBC grav file format
 
+    Files ending with '.npy' are read as the binary float64 block written
+    by write_grav3d_ubc.
+
     INPUT:
     :param fileName, path to the UBC obs grav file
     :param ftype, 'dobs' 'dpred' 'survey'
@@ -134,34 +188,18 @@ def read_grav3d_ubc(obs_file):
     from ...potential_fields import gravity
     from ...data import Data
 
-    fid = open(obs_file, "r")
-
-    # First line has the number of rows
-    line = fid.readline()
-    ndat = int(line.split()[0])
-
-    # Pre-allocate space for obsx, obsy, obsz, data, uncert
-    line = fid.readline()
+    if os.fspath(obs_file).endswith(_BINARY_EXTENSION):
+        locXYZ, d, wd = _split_block(_read_binary_block(obs_file))
 
-    d = np.zeros(ndat, dtype=float)
-    wd = np.zeros(ndat, dtype=float)
-    locXYZ = np.zeros((ndat, 3), dtype=float)
-
-    ii = 0
-    while ii < ndat:
-
-        temp = np.array(line.split(), dtype=float)
-        if len(temp) > 0:
-            locXYZ[ii, :] = temp[:3]
-            if len(temp) > 3:
-                d[ii] = temp[3]
+    else:
+        with open(obs_file, "r") as fid:
 
-                if len(temp) == 5:
-                    wd[ii] = temp[4]
+            # First line has the number of rows
+            line = fid.readline()
+            ndat = int(line.split()[0])
 
-            ii += 1
-        line = fid.readline()
-    fid.close()
+            # Remaining lines have obsx, obsy, obsz, data, uncert
+            locXYZ, d, wd = _split_block(_read_text_block(fid, ndat))
 
     if np.all(wd == 0.0):
         wd = None
@@ -184,6 +222,10 @@ def write_grav3d_ubc(filename, data_object):
     """
         Write UBC grav file format
 
+        If the file name ends with '.npy', the locations and data are
+        written as a single binary float64 block instead, which can be
+        read back with read_grav3d_ubc.
+
         INPUT:
         :param: fileName, path to the UBC obs grav file
         :param: survey Gravity object
@@ -202,12 +244,22 @@ def write_grav3d_ubc(filename, data_object):
     if data_object.standard_deviation is not None:
         data = np.c_[data, data_object.standard_deviation]
 
-    head = "%i\n" % survey.nD
-    np.savetxt(
-        filename, data, fmt="%e", delimiter=" ", newline="\n", header=head, comments=""
-    )
+    if os.fspath(filename).endswith(_BINARY_EXTENSION):
+        _write_binary_block(filename, data)
+    else:
+        head = "%i\n" % survey.nD
+        with open(filename, "w", buffering=WRITE_BUFFER_SIZE) as fid:
+            np.savetxt(
+                fid,
+                data,
+                fmt="%e",
+                delimiter=" ",
+                newline="\n",
+                header=head,
+                comments="",
+            )
 
-    print("Observation file saved to: " + filename)
+    print("Observation file saved to: {}".format(filename))
 
 
 def read_gg3d_ubc(obs_file):
@@ -251,32 +303,18 @@ def read_gg3d_ubc(obs_file):
         line = fid.readline()
         ndat = int(line.split()[0])
 
-        locXYZ = np.zeros((ndat, 3), dtype=float)
-        d = []
-        wd = []
-
-        ii = 0
-        while ii < ndat:
-            try:
-                line = fid.readline()
-                temp = np.array(line.split(), dtype=float)
-                locXYZ[ii, :] = temp[:3]
-                if len(temp) == 3 + n_comp:
-                    d.append(factor * temp[3:])
-                elif len(temp) == 3 + n_comp * 2:
-                    d.append(factor * temp[3 : 3 + n_comp])
-                    wd.append(temp[3 + n_comp :])
-                ii += 1
-            except:
-                raise IOError(f"Unable to read data line {ii}: {line}")
+        block = _read_text_block(fid, ndat)
+
+    locXYZ = np.array(block[:, :3], dtype=float)
+    n_col = block.shape[1]
 
     # Turn into vector. For multiple components, SimPEG orders by rows
-    if len(d) > 0:
-        d = mkvc(np.stack(d).T)
+    if n_col in [3 + n_comp, 3 + n_comp * 2]:
+        d = mkvc((factor * block[:, 3 : 3 + n_comp]).T)
     else:
         d = None
-    if len(wd) > 0:
-        wd = mkvc(np.stack(wd).T)
+    if n_col == 3 + n_comp * 2:
+        wd = mkvc(block[:, 3 + n_comp :].T)
     else:
         wd = None
 
@@ -327,17 +365,18 @@ def write_gg3d_ubc(filename, data_object):
 
     head = ("datacomp=%s\n" % components) + ("%i" % n_loc)
 
-    np.savetxt(
-        filename,
-        output,
-        fmt="%e",
-        delimiter=" ",
-        newline="\n",
-        header=head,
-        comments="",
-    )
-
-    print("Observation file saved to: " + filename)
+    with open(filename, "w", buffering=WRITE_BUFFER_SIZE) as fid:
+        np.savetxt(
+            fid,
+            output,
+            fmt="%e",
+            delimiter=" ",
+            newline="\n",
+            header=head,
+            comments="",
+        )
+
+    print("Observation file saved to: {}".format(filename))
 
 
 # ======================================================
@@ -17,325 +17,266 @@ from SimPEG.utils.io_utils import (
     write_dcipoctree_ubc,
     read_dcipoctree_ubc,
 )
+import logging
 import os
+import pathlib
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+# Write test files to a memory backed file system when available
+if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+    TMP_ROOT = "/dev/shm"
+else:
+    TMP_ROOT = None
 
 
 ####################################################################################
 #                                  POTENTIAL FIELDS
 ####################################################################################
 
-print("==========================================")
-print("           TESTING GRAVITY IO")
-print("==========================================")
-
 
-class TestIO_GRAV3D(unittest.TestCase):
+class BasePotentialFieldIOTest(object):
     """
-    A class for testing the read/write for UBC grav3d formatted data files.
+    Read/write tests shared by the UBC potential field data file formats.
+
+    Subclasses set the reader/writer pair, the receiver components and the
+    survey module. The survey, data and uncertainties are built once per class.
     """
 
-    def setUp(self):
+    name = None
+    module = gravity
+    components = ["gz"]
+    source_parameters = {}
+    extension = None
+    write = None
+    read = None
+    dobs_range = (0.0, 10.0)
+    exact = False
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls._tmp = tempfile.TemporaryDirectory(dir=TMP_ROOT)
+
+        n_loc = 5
+        n_data = len(cls.components) * n_loc
+
+        rng = np.random.default_rng(8)
+        xyz = rng.uniform(0, 100, (n_loc, 3))
+        dobs_min, dobs_max = cls.dobs_range
+        dobs = np.empty(n_data, dtype=np.float64)
+        rng.random(out=dobs)
+        dobs *= dobs_max - dobs_min
+        dobs += dobs_min
+        std = np.empty(n_data, dtype=np.float64)
+        rng.random(out=std)
+        std *= 9.0
+        std += 1.0
+
+        receiver_list = [cls.module.receivers.Point(xyz, components=cls.components)]
+        source_field = cls.module.sources.SourceField(
+            receiver_list=receiver_list, **cls.source_parameters
+        )
+        survey = cls.module.survey.Survey(source_field)
+
+        cls.survey = survey
+        cls.dobs = dobs
+        cls.std = std
 
-        np.random.seed(8)
-        x = np.random.uniform(0, 100, 5)
-        y = np.random.uniform(0, 100, 5)
-        z = np.random.uniform(0, 100, 5)
-        dobs = np.random.uniform(0, 10, 5)
-        std = np.random.uniform(1, 10, 5)
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
 
-        xyz = np.c_[x, y, z]
-        receiver_list = [gravity.receivers.Point(xyz, components="gz")]
-        source_field = gravity.sources.SourceField(receiver_list=receiver_list)
-        survey = gravity.survey.Survey(source_field)
+    def assert_loaded(self, expected, loaded):
 
-        self.survey = survey
-        self.dobs = dobs
-        self.std = std
+        if self.exact:
+            self.assertTrue(np.array_equal(expected, loaded))
+        else:
+            self.assertTrue(np.allclose(expected, loaded))
+
+    def assert_survey_loaded(self, data_loaded):
+
+        self.assert_loaded(
+            self.survey.receiver_locations, data_loaded.survey.receiver_locations
+        )
+
+        if "parameters" in self.source_parameters:
+            passed = np.allclose(
+                self.survey.source_field.parameters,
+                data_loaded.survey.source_field.parameters,
+            )
+            self.assertTrue(passed)
 
     def test_io_survey(self):
 
         data_object = Data(survey=self.survey)
-        filename = "survey.grv"
+        filename = os.path.join(self._tmp.name, "survey" + self.extension)
 
-        write_grav3d_ubc(filename, data_object)
-        data_loaded = read_grav3d_ubc(filename)
-        os.remove(filename)
+        self.write(filename, data_object)
+        data_loaded = self.read(filename)
 
-        passed = np.all(
-            np.isclose(
-                self.survey.receiver_locations, data_loaded.survey.receiver_locations
-            )
-        )
-        self.assertTrue(passed, True)
+        self.assert_survey_loaded(data_loaded)
 
-        print("SURVEY FILE IO FOR GRAV3D PASSED")
+        logger.debug("SURVEY FILE IO FOR {} PASSED".format(self.name))
 
     def test_io_dpred(self):
 
         data_object = Data(survey=self.survey, dobs=self.dobs)
-        filename = "dpred.grv"
+        filename = os.path.join(self._tmp.name, "dpred" + self.extension)
 
-        write_grav3d_ubc(filename, data_object)
-        data_loaded = read_grav3d_ubc(filename)
-        os.remove(filename)
+        self.write(filename, data_object)
+        data_loaded = self.read(filename)
 
-        passed = np.all(
-            np.isclose(
-                np.c_[self.survey.receiver_locations, self.dobs],
-                np.c_[data_loaded.survey.receiver_locations, data_loaded.dobs],
-            )
-        )
-        self.assertTrue(passed, True)
+        self.assert_survey_loaded(data_loaded)
+        self.assert_loaded(self.dobs, data_loaded.dobs)
 
-        print("PREDICTED DATA FILE IO FOR GRAV3D PASSED")
+        logger.debug("PREDICTED DATA FILE IO FOR {} PASSED".format(self.name))
 
     def test_io_dobs(self):
 
         data_object = Data(
             survey=self.survey, dobs=self.dobs, standard_deviation=self.std
         )
-        filename = "dpred.grv"
-
-        write_grav3d_ubc(filename, data_object)
-        data_loaded = read_grav3d_ubc(filename)
-        os.remove(filename)
-
-        passed = np.all(
-            np.isclose(
-                np.c_[self.survey.receiver_locations, self.dobs, self.std],
-                np.c_[
-                    data_loaded.survey.receiver_locations,
-                    data_loaded.dobs,
-                    data_loaded.standard_deviation,
-                ],
-            )
-        )
-        self.assertTrue(passed, True)
+        filename = pathlib.Path(self._tmp.name) / ("dobs" + self.extension)
 
-        print("OBSERVED DATA FILE IO FOR GRAV3D PASSED")
+        self.write(filename, data_object)
+        data_loaded = self.read(filename)
 
+        self.assert_survey_loaded(data_loaded)
+        self.assert_loaded(self.dobs, data_loaded.dobs)
+        self.assert_loaded(self.std, data_loaded.standard_deviation)
 
-print("==========================================")
-print("     TESTING GRAVITY GRADIOMETRY IO")
-print("==========================================")
+        logger.debug("OBSERVED DATA FILE IO FOR {} PASSED".format(self.name))
 
 
-class TestIO_GG3D(unittest.TestCase):
+class BaseUBCTextIOTest(BasePotentialFieldIOTest):
     """
-    A class for testing the read/write for UBC gg3d formatted data files.
+    Tests for malformed data rows in UBC formatted text files.
     """
 
-    def setUp(self):
-
-        np.random.seed(8)
-        x = np.random.uniform(0, 100, 5)
-        y = np.random.uniform(0, 100, 5)
-        z = np.random.uniform(0, 100, 5)
-        dobs = np.random.uniform(0, 100, 6 * 5)
-        std = np.random.uniform(1, 10, 6 * 5)
+    def write_edited_dobs_file(self, filename, edit):
+        """Write a dobs file, then rewrite its lines as edit(lines)."""
 
-        components = ["gxx", "gxy", "gxz", "gyy", "gyz", "gzz"]
-        xyz = np.c_[x, y, z]
-        receiver_list = [gravity.receivers.Point(xyz, components=components)]
-        source_field = gravity.sources.SourceField(receiver_list=receiver_list)
-        survey = gravity.survey.Survey(source_field)
-
-        self.survey = survey
-        self.dobs = dobs
-        self.std = std
-
-    def test_io_survey(self):
+        data_object = Data(
+            survey=self.survey, dobs=self.dobs, standard_deviation=self.std
+        )
+        self.write(filename, data_object)
 
-        data_object = Data(survey=self.survey)
-        filename = "survey.gg"
+        with open(filename, "r") as fid:
+            lines = fid.readlines()
+        with open(filename, "w") as fid:
+            fid.writelines(edit(lines))
 
-        write_gg3d_ubc(filename, data_object)
-        data_loaded = read_gg3d_ubc(filename)
-        os.remove(filename)
+    def test_io_trailing_lines(self):
 
-        passed = np.all(
-            np.isclose(
-                self.survey.receiver_locations, data_loaded.survey.receiver_locations
-            )
+        filename = os.path.join(self._tmp.name, "trailer" + self.extension)
+        self.write_edited_dobs_file(
+            filename, lambda lines: lines + ["\n", "trailing notes\n", "1 2\n"]
         )
-        self.assertTrue(passed, True)
+        data_loaded = self.read(filename)
 
-        print("SURVEY FILE IO FOR GG3D PASSED")
+        self.assert_survey_loaded(data_loaded)
+        self.assert_loaded(self.dobs, data_loaded.dobs)
+        self.assert_loaded(self.std, data_loaded.standard_deviation)
 
-    def test_io_dpred(self):
-
-        data_object = Data(survey=self.survey, dobs=self.dobs)
-        filename = "dpred.gg"
+        logger.debug("TRAILING LINES FILE IO FOR {} PASSED".format(self.name))
 
-        write_gg3d_ubc(filename, data_object)
-        data_loaded = read_gg3d_ubc(filename)
-        os.remove(filename)
+    def test_io_short_file(self):
 
-        passed = np.all(
-            np.isclose(
-                self.survey.receiver_locations, data_loaded.survey.receiver_locations
-            )
-        )
-        self.assertTrue(passed, True)
+        filename = os.path.join(self._tmp.name, "short" + self.extension)
+        self.write_edited_dobs_file(filename, lambda lines: lines[:-1])
 
-        passed = np.all(np.isclose(self.dobs, data_loaded.dobs))
-        self.assertTrue(passed, True)
+        with self.assertRaises(IOError):
+            self.read(filename)
 
-        print("PREDICTED DATA FILE IO FOR GG3D PASSED")
+        logger.debug("SHORT FILE ERROR FOR {} PASSED".format(self.name))
 
-    def test_io_dobs(self):
+    def test_io_bad_row(self):
 
-        data_object = Data(
-            survey=self.survey, dobs=self.dobs, standard_deviation=self.std
+        filename = os.path.join(self._tmp.name, "bad_row" + self.extension)
+        self.write_edited_dobs_file(
+            filename, lambda lines: lines[:-1] + ["1.0 2.0 abc\n"]
         )
-        filename = "dpred.gg"
 
-        write_gg3d_ubc(filename, data_object)
-        data_loaded = read_gg3d_ubc(filename)
-        os.remove(filename)
+        with self.assertRaises(IOError):
+            self.read(filename)
 
-        passed = np.all(
-            np.isclose(
-                self.survey.receiver_locations, data_loaded.survey.receiver_locations
-            )
-        )
-        self.assertTrue(passed, True)
-
-        passed = np.all(np.isclose(self.dobs, data_loaded.dobs))
-        self.assertTrue(passed, True)
+        logger.debug("BAD ROW ERROR FOR {} PASSED".format(self.name))
 
-        passed = np.all(np.isclose(self.std, data_loaded.standard_deviation))
-        self.assertTrue(passed, True)
+    def test_io_comment_row(self):
 
-        print("OBSERVED DATA FILE IO FOR GG3D PASSED")
+        filename = os.path.join(self._tmp.name, "comment_row" + self.extension)
+        self.write_edited_dobs_file(
+            filename, lambda lines: lines[:-1] + ["# not a data row\n"]
+        )
 
+        with self.assertRaises(IOError):
+            self.read(filename)
 
-print("==========================================")
-print("         TESTING MAGNETICS IO")
-print("==========================================")
+        logger.debug("COMMENT ROW ERROR FOR {} PASSED".format(self.name))
 
 
-class TestIO_MAG3D(unittest.TestCase):
+class TestIO_GRAV3D(BaseUBCTextIOTest, unittest.TestCase):
     """
-    A class for testing the read/write for UBC mag3d formatted data files.
+    A class for testing the read/write for UBC grav3d formatted data files.
     """
 
-    def setUp(self):
-
-        np.random.seed(8)
-        x = np.random.uniform(0, 100, 5)
-        y = np.random.uniform(0, 100, 5)
-        z = np.random.uniform(0, 100, 5)
-        dobs = np.random.uniform(0, 10, 5)
-        std = np.random.uniform(1, 10, 5)
-
-        xyz = np.c_[x, y, z]
-        receiver_list = [magnetics.receivers.Point(xyz, components="tmi")]
-
-        inducing_field = (50000.0, 60.0, 15.0)
-        source_field = magnetics.sources.SourceField(
-            receiver_list=receiver_list, parameters=inducing_field
-        )
-        survey = gravity.survey.Survey(source_field)
-
-        self.survey = survey
-        self.dobs = dobs
-        self.std = std
-
-    def test_io_survey(self):
-
-        data_object = Data(survey=self.survey)
-        filename = "survey.mag"
-
-        write_mag3d_ubc(filename, data_object)
-        data_loaded = read_mag3d_ubc(filename)
-        os.remove(filename)
+    name = "GRAV3D"
+    extension = ".grv"
+    write = staticmethod(write_grav3d_ubc)
+    read = staticmethod(read_grav3d_ubc)
 
-        passed = np.all(
-            np.isclose(
-                self.survey.receiver_locations, data_loaded.survey.receiver_locations
-            )
-        )
-        self.assertTrue(passed, True)
 
-        passed = np.all(
-            np.isclose(
-                self.survey.source_field.parameters,
-                data_loaded.survey.source_field.parameters,
-            )
-        )
-        self.assertTrue(passed, True)
-
-        print("SURVEY FILE IO FOR MAG3D PASSED")
-
-    def test_io_dpred(self):
-
-        data_object = Data(survey=self.survey, dobs=self.dobs)
-        filename = "dpred.mag"
-
-        write_mag3d_ubc(filename, data_object)
-        data_loaded = read_mag3d_ubc(filename)
-        os.remove(filename)
+class TestIO_GRAV3D_binary(BasePotentialFieldIOTest, unittest.TestCase):
+    """
+    A class for testing the binary .npy read/write of grav3d data files.
+    """
 
-        passed = np.all(
-            np.isclose(
-                np.c_[self.survey.receiver_locations, self.dobs],
-                np.c_[data_loaded.survey.receiver_locations, data_loaded.dobs],
-            )
-        )
-        self.assertTrue(passed, True)
+    name = "GRAV3D BINARY"
+    extension = ".grv.npy"
+    exact = True
+    write = staticmethod(write_grav3d_ubc)
+    read = staticmethod(read_grav3d_ubc)
 
-        passed = np.all(
-            np.isclose(
-                self.survey.source_field.parameters,
-                data_loaded.survey.source_field.parameters,
-            )
-        )
-        self.assertTrue(passed, True)
 
-        print("PREDICTED DATA FILE IO FOR MAG3D PASSED")
+class TestIO_GG3D(BaseUBCTextIOTest, unittest.TestCase):
+    """
+    A class for testing the read/write for UBC gg3d formatted data files.
+    """
 
-    def test_io_dobs(self):
+    name = "GG3D"
+    components = ["gxx", "gxy", "gxz", "gyy", "gyz", "gzz"]
+    dobs_range = (0.0, 100.0)
+    extension = ".gg"
+    write = staticmethod(write_gg3d_ubc)
+    read = staticmethod(read_gg3d_ubc)
 
-        data_object = Data(
-            survey=self.survey, dobs=self.dobs, standard_deviation=self.std
-        )
-        filename = "dpred.mag"
-
-        write_mag3d_ubc(filename, data_object)
-        data_loaded = read_mag3d_ubc(filename)
-        os.remove(filename)
-
-        passed = np.all(
-            np.isclose(
-                np.c_[self.survey.receiver_locations, self.dobs, self.std],
-                np.c_[
-                    data_loaded.survey.receiver_locations,
-                    data_loaded.dobs,
-                    data_loaded.standard_deviation,
-                ],
-            )
-        )
-        self.assertTrue(passed, True)
 
-        passed = np.all(
-            np.isclose(
-                self.survey.source_field.parameters,
-                data_loaded.survey.source_field.parameters,
-            )
-        )
-        self.assertTrue(passed, True)
+class TestIO_MAG3D(BaseUBCTextIOTest, unittest.TestCase):
+    """
+    A class for testing the read/write for UBC mag3d formatted data files.
+    """
 
-        print("OBSERVED DATA FILE IO FOR MAG3D PASSED")
+    name = "MAG3D"
+    module = magnetics
+    components = ["tmi"]
+    source_parameters = {"parameters": (50000.0, 60.0, 15.0)}
+    extension = ".mag"
+    write = staticmethod(write_mag3d_ubc)
+    read = staticmethod(read_mag3d_ubc)
 
 
 ####################################################################################
 #                        ELECTROMAGNETICS (STATICS)
 ####################################################################################
 
-print("==========================================")
-print("            TESTING DCIP IO")
-print("==========================================")
+
+def get_abmn_locations(survey):
+    """Stack the A, B, M and N electrode locations of a DC survey."""
+    return np.c_[
+        survey.a_locations, survey.b_locations, survey.m_locations, survey.n_locations,
+    ]
 
 
 class TestIO_DCIP3D(unittest.TestCase):
@@ -343,241 +284,186 @@ class TestIO_DCIP3D(unittest.TestCase):
     A class for testing the read/write for UBC dcip3d and dcipoctree formatted data files.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+
+        cls._tmp = tempfile.TemporaryDirectory(dir=TMP_ROOT)
 
         # Receiver locations
-        np.random.seed(8)
+        rng = np.random.default_rng(8)
         xm = np.array([40.0, 50.0, 60.0])
         xn = np.array([70.0, 80.0, 90.0])
-        ym = np.random.uniform(-5, 5, len(xm))
-        zm = np.random.randn(len(xm))
-        m_locs = np.c_[xm, ym, zm]
-        n_locs = np.c_[xn, ym, zm]
+        m_locs = np.empty((len(xm), 3))
+        m_locs[:, 0] = xm
+        m_locs[:, 1] = rng.uniform(-5, 5, len(xm))
+        m_locs[:, 2] = rng.standard_normal(len(xm))
+        n_locs = m_locs.copy()
+        n_locs[:, 0] = xn
 
         # Source locations
-        np.random.seed(9)
+        rng = np.random.default_rng(9)
         xa = np.array([0.0, 10.0])
         xb = np.array([20.0, 30.0])
-        ya = np.random.uniform(-5, 5, len(xa))
-        za = np.random.randn(len(xa))
-        a_locs = np.c_[xa, ya, za]
-        b_locs = np.c_[xb, ya, za]
-
-        n_src = len(xa)
-        n_rx = len(xm)
-
-        # Define survey
-        pp_sources = []
-        dpdp_sources = []
-
-        for ii in range(0, n_src):
-
-            pp_receivers = [dc.receivers.Pole(m_locs)]
-            dpdp_receivers = [dc.receivers.Dipole(m_locs, n_locs)]
-
-            a_loc = a_locs[ii, :]
-            b_loc = b_locs[ii, :]
+        a_locs = np.empty((len(xa), 3))
+        a_locs[:, 0] = xa
+        a_locs[:, 1] = rng.uniform(-5, 5, len(xa))
+        a_locs[:, 2] = rng.standard_normal(len(xa))
+        b_locs = a_locs.copy()
+        b_locs[:, 0] = xb
+
+        # Define survey. Each source gets a single receiver object holding all
+        # M (and N) electrode locations. Receivers are not shared between
+        # sources since they carry per-source state (e.g. geometric factors).
+        pp_sources = [dc.sources.Pole([dc.receivers.Pole(m_locs)], a) for a in a_locs]
+        dpdp_sources = [
+            dc.sources.Dipole([dc.receivers.Dipole(m_locs, n_locs)], a, b)
+            for a, b in zip(a_locs, b_locs)
+        ]
 
-            pp_sources.append(dc.sources.Pole(pp_receivers, a_loc))
-            dpdp_sources.append(dc.sources.Dipole(dpdp_receivers, a_loc, b_loc))
+        cls.pp_survey = dc.survey.Survey(pp_sources, survey_type="pole-pole")
+        cls.dpdp_survey = dc.survey.Survey(dpdp_sources, survey_type="dipole-dipole")
 
-        self.pp_survey = dc.survey.Survey(pp_sources, survey_type="pole-pole")
-        self.dpdp_survey = dc.survey.Survey(dpdp_sources, survey_type="dipole-dipole")
+        # Reference electrode locations shared by all tests
+        cls._pp_ref = get_abmn_locations(cls.pp_survey)
+        cls._dpdp_ref = get_abmn_locations(cls.dpdp_survey)
 
         # Define data and uncertainties. In this case nD = 6
         n_data = len(xa) * len(xm)
 
-        np.random.seed(10)
-        dobs = np.random.uniform(1e-3, 1e-2, n_data)
-        std = np.random.uniform(1e-5, 1e-4, n_data)
+        rng = np.random.default_rng(10)
+        dobs = rng.uniform(1e-3, 1e-2, n_data)
+        std = rng.uniform(1e-5, 1e-4, n_data)
 
-        self.dobs = dobs
-        self.std = std
+        cls.dobs = dobs
+        cls.std = std
 
-    def test_io_survey(self):
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
 
-        pp_data = Data(survey=self.pp_survey)
-        dpdp_data = Data(survey=self.dpdp_survey)
+    def test_io_survey_pp(self):
 
-        filename = "survey.dc"
+        data_object = Data(survey=self.pp_survey)
+        filename = os.path.join(self._tmp.name, "survey_pp.dc")
 
-        # Test for pole-pole
         write_dcip3d_ubc(
-            filename, pp_data, "secondary_potential", "survey", format_type="general"
+            filename,
+            data_object,
+            "secondary_potential",
+            "survey",
+            format_type="general",
         )
         data_loaded = read_dcip3d_ubc(filename, "secondary_potential")
-        os.remove(filename)
 
-        A = np.c_[
-            self.pp_survey.a_locations,
-            self.pp_survey.b_locations,
-            self.pp_survey.m_locations,
-            self.pp_survey.n_locations,
-        ]
+        A = self._pp_ref
+        B = get_abmn_locations(data_loaded.survey)
 
-        B = np.c_[
-            data_loaded.survey.a_locations,
-            data_loaded.survey.b_locations,
-            data_loaded.survey.m_locations,
-            data_loaded.survey.n_locations,
-        ]
+        passed = np.allclose(A, B)
+        self.assertTrue(passed)
 
-        passed = np.all(np.isclose(A, B))
-        self.assertTrue(passed, True)
+        logger.debug("POLE-POLE SURVEY FILE IO FOR DCIP3D PASSED")
+
+    def test_io_survey_dpdp(self):
+
+        data_object = Data(survey=self.dpdp_survey)
+        filename = os.path.join(self._tmp.name, "survey_dpdp.dc")
 
-        # Test for dipole-dipole
         write_dcipoctree_ubc(
-            filename, dpdp_data, "volt", "survey", format_type="general"
+            filename, data_object, "volt", "survey", format_type="general"
         )
         data_loaded = read_dcipoctree_ubc(filename, "volt")
-        os.remove(filename)
 
-        A = np.c_[
-            self.dpdp_survey.a_locations,
-            self.dpdp_survey.b_locations,
-            self.dpdp_survey.m_locations,
-            self.dpdp_survey.n_locations,
-        ]
+        A = self._dpdp_ref
+        B = get_abmn_locations(data_loaded.survey)
 
-        B = np.c_[
-            data_loaded.survey.a_locations,
-            data_loaded.survey.b_locations,
-            data_loaded.survey.m_locations,
-            data_loaded.survey.n_locations,
-        ]
+        passed = np.allclose(A, B)
+        self.assertTrue(passed)
 
-        passed = np.all(np.isclose(A, B))
-        self.assertTrue(passed, True)
+        logger.debug("DIPOLE-DIPOLE SURVEY FILE IO FOR DCIPOCTREE PASSED")
 
-        print("SURVEY FILE IO FOR DCIP3D PASSED")
+    def test_io_dpred_pp(self):
 
-    def test_io_dpred(self):
-
-        pp_data = Data(survey=self.pp_survey, dobs=self.dobs)
-        dpdp_data = Data(survey=self.dpdp_survey, dobs=self.dobs)
+        data_object = Data(survey=self.pp_survey, dobs=self.dobs)
+        filename = os.path.join(self._tmp.name, "dpred_pp.dc")
 
-        filename = "dpred.dc"
-
-        # Test for pole-pole
         write_dcip3d_ubc(
-            filename, pp_data, "secondary_potential", "dpred", format_type="general"
+            filename, data_object, "secondary_potential", "dpred", format_type="general"
         )
         data_loaded = read_dcip3d_ubc(filename, "secondary_potential")
-        os.remove(filename)
-
-        A = np.c_[
-            self.pp_survey.a_locations,
-            self.pp_survey.b_locations,
-            self.pp_survey.m_locations,
-            self.pp_survey.n_locations,
-            self.dobs,
-        ]
 
-        B = np.c_[
-            data_loaded.survey.a_locations,
-            data_loaded.survey.b_locations,
-            data_loaded.survey.m_locations,
-            data_loaded.survey.n_locations,
-            data_loaded.dobs,
-        ]
+        A = np.c_[self._pp_ref, self.dobs]
+        B = np.c_[get_abmn_locations(data_loaded.survey), data_loaded.dobs]
+
+        passed = np.allclose(A, B)
+        self.assertTrue(passed)
 
-        passed = np.all(np.isclose(A, B))
-        self.assertTrue(passed, True)
+        logger.debug("POLE-POLE PREDICTED DATA FILE IO FOR DCIP3D PASSED")
+
+    def test_io_dpred_dpdp(self):
+
+        data_object = Data(survey=self.dpdp_survey, dobs=self.dobs)
+        filename = os.path.join(self._tmp.name, "dpred_dpdp.dc")
 
-        # Test for dipole-dipole
         write_dcipoctree_ubc(
-            filename, dpdp_data, "volt", "dpred", format_type="general"
+            filename, data_object, "volt", "dpred", format_type="general"
         )
         data_loaded = read_dcipoctree_ubc(filename, "volt")
-        os.remove(filename)
-
-        A = np.c_[
-            self.dpdp_survey.a_locations,
-            self.dpdp_survey.b_locations,
-            self.dpdp_survey.m_locations,
-            self.dpdp_survey.n_locations,
-            self.dobs,
-        ]
 
-        B = np.c_[
-            data_loaded.survey.a_locations,
-            data_loaded.survey.b_locations,
-            data_loaded.survey.m_locations,
-            data_loaded.survey.n_locations,
-            data_loaded.dobs,
-        ]
+        A = np.c_[self._dpdp_ref, self.dobs]
+        B = np.c_[get_abmn_locations(data_loaded.survey), data_loaded.dobs]
 
-        passed = np.all(np.isclose(A, B))
-        self.assertTrue(passed, True)
+        passed = np.allclose(A, B)
+        self.assertTrue(passed)
 
-        print("PREDICTED DATA FILE IO FOR DCIP3D PASSED")
+        logger.debug("DIPOLE-DIPOLE PREDICTED DATA FILE IO FOR DCIPOCTREE PASSED")
 
-    def test_io_dobs(self):
+    def test_io_dobs_pp(self):
 
-        pp_data = Data(
+        data_object = Data(
             survey=self.pp_survey, dobs=self.dobs, standard_deviation=self.std
         )
-        dpdp_data = Data(
-            survey=self.dpdp_survey, dobs=self.dobs, standard_deviation=self.std
-        )
-
-        filename = "dobs.dc"
+        filename = os.path.join(self._tmp.name, "dobs_pp.dc")
 
-        # Test for pole-pole
         write_dcip3d_ubc(
-            filename, pp_data, "secondary_potential", "dobs", format_type="general"
+            filename, data_object, "secondary_potential", "dobs", format_type="general"
         )
         data_loaded = read_dcip3d_ubc(filename, "secondary_potential")
-        os.remove(filename)
-
-        A = np.c_[
-            self.pp_survey.a_locations,
-            self.pp_survey.b_locations,
-            self.pp_survey.m_locations,
-            self.pp_survey.n_locations,
-            self.dobs,
-            self.std,
-        ]
 
+        A = np.c_[self._pp_ref, self.dobs, self.std]
         B = np.c_[
-            data_loaded.survey.a_locations,
-            data_loaded.survey.b_locations,
-            data_loaded.survey.m_locations,
-            data_loaded.survey.n_locations,
+            get_abmn_locations(data_loaded.survey),
             data_loaded.dobs,
             data_loaded.standard_deviation,
         ]
 
-        passed = np.all(np.isclose(A, B))
-        self.assertTrue(passed, True)
+        passed = np.allclose(A, B)
+        self.assertTrue(passed)
+
+        logger.debug("POLE-POLE OBSERVATIONS FILE IO FOR DCIP3D PASSED")
 
-        # Test for dipole-dipole
-        write_dcipoctree_ubc(filename, dpdp_data, "volt", "dobs", format_type="general")
+    def test_io_dobs_dpdp(self):
+
+        data_object = Data(
+            survey=self.dpdp_survey, dobs=self.dobs, standard_deviation=self.std
+        )
+        filename = os.path.join(self._tmp.name, "dobs_dpdp.dc")
+
+        write_dcipoctree_ubc(
+            filename, data_object, "volt", "dobs", format_type="general"
+        )
         data_loaded = read_dcipoctree_ubc(filename, "volt")
-        os.remove(filename)
-
-        A = np.c_[
-            self.dpdp_survey.a_locations,
-            self.dpdp_survey.b_locations,
-            self.dpdp_survey.m_locations,
-            self.dpdp_survey.n_locations,
-            self.dobs,
-            self.std,
-        ]
 
+        A = np.c_[self._dpdp_ref, self.dobs, self.std]
         B = np.c_[
-            data_loaded.survey.a_locations,
-            data_loaded.survey.b_locations,
-            data_loaded.survey.m_locations,
-            data_loaded.survey.n_locations,
+            get_abmn_locations(data_loaded.survey),
             data_loaded.dobs,
             data_loaded.standard_deviation,
         ]
 
-        passed = np.all(np.isclose(A, B))
-        self.assertTrue(passed, True)
+        passed = np.allclose(A, B)
+        self.assertTrue(passed)
 
-        print("OBSERVATIONS FILE IO FOR DCIP3D PASSED")
+        logger.debug("DIPOLE-DIPOLE OBSERVATIONS FILE IO FOR DCIPOCTREE PASSED")
 
 
 if __name__ == "__main__":